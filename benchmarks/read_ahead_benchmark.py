@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# compares serial scanning with --read-ahead when every file read has added latency,
+#   simulating a slow or network-backed filesystem.
+#
+# usage: python benchmarks/read_ahead_benchmark.py [--files N] [--latency-ms MS] [--depth D] [--threads T]
+
+import time
+import argparse
+import tempfile
+import os.path
+
+from tf_authoritative_scanner.scanner import TFAuthoritativeScanner
+
+
+class LatencyInjectedScanner(TFAuthoritativeScanner):
+    latency = 0.0
+
+    # serial path
+    def check_file_for_authoritative_resources(self, file_path):
+        time.sleep(self.latency)
+        return super().check_file_for_authoritative_resources(file_path)
+
+    # read-ahead path
+    def _read_file(self, file_path):
+        time.sleep(self.latency)
+        return super()._read_file(file_path)
+
+
+def write_tf_files(directory, count):
+    for i in range(count):
+        with open(os.path.join(directory, f"file_{i:05}.tf"), "w") as f:
+            for j in range(50):
+                f.write(f'resource "google_compute_instance" "instance_{j}" {{\n  name = "instance-{j}"\n}}\n\n')
+            if i % 10 == 0:
+                f.write('resource "google_project_iam_binding" "binding" {}\n')
+
+
+def time_scan(scanner, directory):
+    start = time.perf_counter()
+    result = scanner.check_paths_for_authoritative_resources([directory])
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tfas read-ahead with injected file read latency.")
+    parser.add_argument("--files", type=int, default=200, help="Number of .tf files to scan")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Latency added to every file read")
+    parser.add_argument("--depth", type=int, default=32, help="Read-ahead queue depth")
+    parser.add_argument("--threads", type=int, default=8, help="Read-ahead I/O threads")
+    args = parser.parse_args()
+
+    LatencyInjectedScanner.latency = args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_tf_files(directory, args.files)
+
+        serial_time, serial_result = time_scan(LatencyInjectedScanner(include_dotdirs=False), directory)
+        read_ahead_time, read_ahead_result = time_scan(
+            LatencyInjectedScanner(include_dotdirs=False, read_ahead=args.depth, io_threads=args.threads), directory
+        )
+        assert serial_result == read_ahead_result
+
+    print(f"files: {args.files}, latency: {args.latency_ms}ms, depth: {args.depth}, threads: {args.threads}")
+    print(f"serial:     {serial_time:.3f}s")
+    print(f"read-ahead: {read_ahead_time:.3f}s")
+    print(f"speedup:    {serial_time / read_ahead_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
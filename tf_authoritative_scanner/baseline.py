@@ -0,0 +1,71 @@
+import os
+import hashlib
+
+from tf_authoritative_scanner.util import get_resource_type_and_name
+
+BASELINE_HEADER = "# tfas baseline v1"
+# truncated sha256 hex digest, 64 bits is plenty for tens of thousands of entries
+FINGERPRINT_LENGTH = 16
+
+
+def normalize_path(file_path):
+    # relative to the current directory and using '/' so the same file matches across machines and OSes
+    path = os.path.abspath(str(file_path))
+    try:
+        path = os.path.relpath(path)
+    except ValueError:
+        # on windows, files on a different drive than the current directory have no relative path
+        pass
+    return path.replace(os.sep, "/")
+
+
+# fingerprints deliberately don't include line numbers, so unrelated edits that shift
+#   a resource up or down in a file don't invalidate the baseline
+def fingerprint(file_path, line):
+    resource_type, resource_name = get_resource_type_and_name(line)
+    if resource_type and resource_name:
+        key = f"{normalize_path(file_path)}\0{resource_type}\0{resource_name}"
+    else:
+        # unparseable declaration, fall back to the whitespace-normalized line so distinct
+        #   findings in the same file never share a fingerprint
+        key = f"{normalize_path(file_path)}\0{' '.join(line.split())}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:FINGERPRINT_LENGTH]
+
+
+class Baseline:
+    def __init__(self, fingerprints=None):
+        self.fingerprints = set(fingerprints or [])
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def __bool__(self):
+        return bool(self.fingerprints)
+
+    def __contains__(self, item):
+        return item in self.fingerprints
+
+    def contains(self, file_path, line):
+        return fingerprint(file_path, line) in self.fingerprints
+
+    def add(self, file_path, line):
+        self.fingerprints.add(fingerprint(file_path, line))
+
+    # can raise FileNotFoundError if the file does not exist
+    @classmethod
+    def load(cls, path):
+        fingerprints = set()
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                fingerprints.add(line)
+        return cls(fingerprints)
+
+    # entries are sorted so baseline files diff cleanly in version control
+    def write(self, path):
+        with open(path, "w") as f:
+            f.write(f"{BASELINE_HEADER}\n")
+            for entry in sorted(self.fingerprints):
+                f.write(f"{entry}\n")
@@ -0,0 +1,131 @@
+import os
+import subprocess
+
+import pytest
+
+from tf_authoritative_scanner.baseline import Baseline, fingerprint, normalize_path
+from tf_authoritative_scanner.scanner import TFAuthoritativeScanner
+
+
+class TestBaseline:
+    @pytest.fixture
+    def tf_file(self, tmp_path):
+        file = tmp_path / "iam.tf"
+        file.write_text('resource "google_project_iam_binding" "old" {}\n')
+        return file
+
+    def test_normalize_path(self, tmp_path):
+        assert normalize_path(tmp_path / "a" / ".." / "b.tf") == normalize_path(tmp_path / "b.tf")
+        assert "\\" not in normalize_path(tmp_path / "b.tf")
+
+    def test_normalize_path_different_drive(self, monkeypatch):
+        def relpath(path, start=None):
+            raise ValueError("path is on mount 'D:', start on mount 'C:'")
+
+        monkeypatch.setattr(os.path, "relpath", relpath)
+        assert normalize_path("/other/drive/b.tf") == "/other/drive/b.tf"
+
+    def test_fingerprint_ignores_line_position(self, tf_file):
+        a = fingerprint(tf_file, 'resource "google_project_iam_binding" "old" {')
+        b = fingerprint(tf_file, 'resource  "google_project_iam_binding"  "old"{')
+        assert a == b
+        # `terraform fmt` adds a space before the brace
+        assert fingerprint(tf_file, 'resource "google_project_iam_binding" "old"{}') == fingerprint(
+            tf_file, 'resource "google_project_iam_binding" "old" {}'
+        )
+        assert a != fingerprint(tf_file, 'resource "google_project_iam_binding" "new" {')
+        assert a != fingerprint("other.tf", 'resource "google_project_iam_binding" "old" {')
+
+    def test_fingerprint_unquoted_and_unparseable(self, tf_file):
+        assert fingerprint(tf_file, "resource google_project_iam_binding a {}") == fingerprint(
+            tf_file, 'resource "google_project_iam_binding" "a" {}'
+        )
+        assert fingerprint(tf_file, "resource google_project_iam_binding") != fingerprint(
+            tf_file, "resource google_project_iam_policy"
+        )
+
+    def test_scanner_unquoted_labels_not_suppressed(self, tf_file):
+        tf_file.write_text("resource google_project_iam_binding a {}\n")
+        baseline = Baseline()
+        baseline.add(tf_file, "resource google_project_iam_binding a {}")
+        tf_file.write_text("resource google_project_iam_binding a {}\nresource google_project_iam_policy zzz {}\n")
+        scanner = TFAuthoritativeScanner(include_dotdirs=False, baseline=baseline)
+        r = scanner.check_file_for_authoritative_resources(tf_file)
+        assert [item["line_number"] for item in r["baselined_lines"]] == [1]
+        assert [item["line_number"] for item in r["authoritative_lines"]] == [2]
+
+    def test_empty_baseline_skips_lookup(self, tf_file, monkeypatch):
+        def contains(self, file_path, line):
+            raise AssertionError("empty baseline shouldn't be consulted")
+
+        monkeypatch.setattr(Baseline, "contains", contains)
+        assert not Baseline()
+        r = TFAuthoritativeScanner(include_dotdirs=False).check_file_for_authoritative_resources(tf_file)
+        assert r["authoritative"]
+
+    def test_write_and_load(self, tmp_path, tf_file):
+        baseline = Baseline()
+        baseline.add(tf_file, 'resource "google_project_iam_binding" "b" {')
+        baseline.add(tf_file, 'resource "google_project_iam_binding" "a" {')
+        path = tmp_path / "baseline.txt"
+        baseline.write(path)
+
+        entries = [line for line in path.read_text().splitlines() if not line.startswith("#")]
+        assert entries == sorted(entries)
+        loaded = Baseline.load(path)
+        assert len(loaded) == 2
+        assert loaded.contains(tf_file, 'resource "google_project_iam_binding" "a" {')
+
+    def test_load_missing(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            Baseline.load(tmp_path / "missing.txt")
+
+    def test_scanner_suppresses_baselined_findings(self, tf_file):
+        baseline = Baseline()
+        baseline.add(tf_file, 'resource "google_project_iam_binding" "old" {}')
+        # shift the existing finding down and add a new one
+        tf_file.write_text(
+            '\n\nresource "google_project_iam_binding" "old" {}\nresource "google_project_iam_binding" "new" {}\n'
+        )
+        scanner = TFAuthoritativeScanner(include_dotdirs=False, baseline=baseline)
+        r = scanner.check_file_for_authoritative_resources(tf_file)
+        assert r["authoritative"]
+        assert [item["line_number"] for item in r["baselined_lines"]] == [3]
+        assert [item["line_number"] for item in r["authoritative_lines"]] == [4]
+
+    # main tests
+
+    def test_main_write_baseline_then_pass(self, tmp_path, tf_file):
+        baseline_path = os.path.join(tmp_path, "tfas_baseline.txt")
+        result = subprocess.run(
+            ["tfas", "-A", "--baseline", baseline_path, "--write-baseline", str(tf_file)],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert "Wrote 1 findings" in result.stdout
+
+        result = subprocess.run(
+            ["tfas", "-A", "--baseline", baseline_path, str(tf_file)], capture_output=True, text=True
+        )
+        assert "PASS: 0 of 1 scanned files are authoritative.\n" in result.stdout
+        assert result.returncode == 0
+
+        tf_file.write_text(tf_file.read_text() + 'resource "google_project_iam_policy" "new" {}\n')
+        result = subprocess.run(
+            ["tfas", "-A", "--baseline", baseline_path, str(tf_file)], capture_output=True, text=True
+        )
+        assert "google_project_iam_policy" in result.stdout
+        assert "google_project_iam_binding" not in result.stdout
+        assert result.returncode == 1
+
+    def test_main_write_baseline_requires_file(self, tf_file):
+        result = subprocess.run(["tfas", "-A", "--write-baseline", str(tf_file)], capture_output=True, text=True)
+        assert result.returncode == 2
+
+    def test_main_missing_baseline(self, tmp_path, tf_file):
+        result = subprocess.run(
+            ["tfas", "-A", "--baseline", str(tmp_path / "missing.txt"), str(tf_file)], capture_output=True, text=True
+        )
+        assert "does not exist" in result.stdout
+        assert result.returncode == 1
@@ -0,0 +1,227 @@
+import os
+import sys
+import json
+import urllib.parse
+
+from tf_authoritative_scanner.util import get_resource_type_and_name
+
+OUTPUT_FORMATS = ["text", "jsonl", "sarif"]
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_RULE_ID = "authoritative-resource"
+INFORMATION_URI = "https://github.com/aerickson/tf_authoritative_scanner"
+# relative artifact uris are resolved against this base, which is the directory tfas was run from
+SARIF_SRCROOT = "SRCROOT"
+
+
+# collects output and writes it to the underlying stream in large chunks instead of
+#   one write per line, which matters when there are 100k+ findings
+class BufferedWriter:
+    def __init__(self, stream=None, buffer_size=64 * 1024):
+        self.stream = stream if stream is not None else sys.stdout
+        self.buffer_size = buffer_size
+        self._chunks = []
+        self._size = 0
+
+    def write(self, text):
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def writeline(self, text=""):
+        self.write(f"{text}\n")
+
+    def flush(self):
+        if self._chunks:
+            self.stream.write("".join(self._chunks))
+            self._chunks = []
+            self._size = 0
+        self.stream.flush()
+
+
+# each formatter gets `file_entry()` called once per scanned file, as soon as the file is scanned,
+#   then `finish()` once with the totals
+class TextFormatter:
+    def __init__(self, writer, verbosity=0):
+        self.writer = writer
+        self.verbosity = verbosity
+
+    def start(self):
+        pass
+
+    def file_entry(self, file_entry):
+        file_path = file_entry["file_path"]
+        if file_entry["authoritative"]:
+            for item in file_entry["authoritative_lines"]:
+                self.writer.writeline(f"AUTHORITATIVE: {file_path}:{item['line_number']}: {item['line']}")
+        elif file_entry["excepted_lines"] or file_entry["baselined_lines"]:
+            if self.verbosity:
+                for item in file_entry["excepted_lines"]:
+                    self.writer.writeline(f"EXCEPTED: {file_path}:{item['line_number']}: {item['line']}")
+                for item in file_entry["baselined_lines"]:
+                    self.writer.writeline(f"BASELINED: {file_path}:{item['line_number']}: {item['line']}")
+        else:
+            if self.verbosity:
+                self.writer.writeline(f"OK: {file_path}")
+
+    def finish(self, authoritative_files_found, total_files):
+        status = "FAIL" if authoritative_files_found > 0 else "PASS"
+        self.writer.writeline(
+            f"{status}: {authoritative_files_found} of {total_files} scanned files are authoritative."
+        )
+
+
+def _findings(file_entry):
+    for status, key in [
+        ("authoritative", "authoritative_lines"),
+        ("excepted", "excepted_lines"),
+        ("baselined", "baselined_lines"),
+    ]:
+        for item in file_entry[key]:
+            yield status, item
+
+
+# one JSON object per line: a "finding" record per authoritative, excepted or baselined resource,
+#   followed by a single "summary" record
+class JsonlFormatter:
+    def __init__(self, writer, verbosity=0):
+        self.writer = writer
+        self.verbosity = verbosity
+
+    def start(self):
+        pass
+
+    def file_entry(self, file_entry):
+        for status, item in _findings(file_entry):
+            resource_type, resource_name = get_resource_type_and_name(item["line"])
+            record = {
+                "type": "finding",
+                "status": status,
+                "file_path": str(file_entry["file_path"]),
+                "line_number": item["line_number"],
+                "resource_type": resource_type,
+                "resource_name": resource_name,
+                "line": item["line"],
+            }
+            self.writer.writeline(json.dumps(record))
+
+    def finish(self, authoritative_files_found, total_files):
+        record = {
+            "type": "summary",
+            "status": "fail" if authoritative_files_found > 0 else "pass",
+            "files_scanned": total_files,
+            "authoritative_files_count": authoritative_files_found,
+        }
+        self.writer.writeline(json.dumps(record))
+
+
+def _file_uri(path):
+    # windows drive paths ('C:/...') need a leading '/' in file uris
+    if not path.startswith("/"):
+        path = f"/{path}"
+    return f"file://{urllib.parse.quote(path, safe='/!:')}"
+
+
+# returns a valid uri reference for a scanned file path, e.g. 'dir/my%20module.tf'.
+#   relative paths stay relative (see SARIF_SRCROOT), absolute paths become file:// uris.
+def _sarif_artifact_location(file_path):
+    path = os.path.normpath(str(file_path)).replace(os.sep, "/")
+    if os.path.isabs(str(file_path)):
+        return {"uri": _file_uri(path)}
+    return {"uri": urllib.parse.quote(path), "uriBaseId": SARIF_SRCROOT}
+
+
+# findings in files on disk point at the file and line. findings in archive members point at the
+#   archive itself (the only artifact that exists on disk), with the member and its line number in
+#   a logical location and properties.
+def _sarif_location(file_entry, line_number):
+    archive_path = file_entry.get("archive_path")
+    if archive_path is None:
+        return {
+            "physicalLocation": {
+                "artifactLocation": _sarif_artifact_location(file_entry["file_path"]),
+                "region": {"startLine": line_number},
+            }
+        }
+    member_name = file_entry["member_name"]
+    return {
+        "physicalLocation": {"artifactLocation": _sarif_artifact_location(archive_path)},
+        "logicalLocations": [{"name": member_name, "fullyQualifiedName": str(file_entry["file_path"])}],
+        "properties": {"archiveMember": member_name, "archiveMemberLine": line_number},
+    }
+
+
+# the document is written as it goes: the header up to the opening of the `results` array,
+#   then one result per finding, then the closing brackets. excepted and baselined findings are
+#   included as suppressed results.
+class SarifFormatter:
+    def __init__(self, writer, verbosity=0, version=None):
+        self.writer = writer
+        self.verbosity = verbosity
+        self.version = version
+        self._first_result = True
+        self._suffix = ""
+
+    def start(self):
+        driver = {
+            "name": "tfas",
+            "informationUri": INFORMATION_URI,
+            "rules": [
+                {
+                    "id": SARIF_RULE_ID,
+                    "shortDescription": {"text": "Terraform authoritative resource"},
+                    "helpUri": INFORMATION_URI,
+                }
+            ],
+        }
+        if self.version:
+            driver["version"] = self.version
+        document = {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {"driver": driver},
+                    "originalUriBaseIds": {
+                        SARIF_SRCROOT: {"uri": _file_uri(f"{os.getcwd().replace(os.sep, '/').rstrip('/')}/")}
+                    },
+                    "results": [],
+                }
+            ],
+        }
+        # split the serialized document at the empty results array so results can be streamed into it
+        prefix, self._suffix = json.dumps(document).split('"results": []')
+        self.writer.write(f'{prefix}"results": [')
+
+    def file_entry(self, file_entry):
+        for status, item in _findings(file_entry):
+            resource_type, _resource_name = get_resource_type_and_name(item["line"])
+            result = {
+                "ruleId": SARIF_RULE_ID,
+                "level": "error",
+                "message": {
+                    "text": f"Authoritative resource '{resource_type}' at "
+                    f"{file_entry['file_path']}:{item['line_number']}: {item['line']}"
+                },
+                "locations": [_sarif_location(file_entry, item["line_number"])],
+            }
+            if status == "excepted":
+                result["suppressions"] = [{"kind": "inSource"}]
+            elif status == "baselined":
+                result["suppressions"] = [{"kind": "external"}]
+            self.writer.write(json.dumps(result) if self._first_result else f", {json.dumps(result)}")
+            self._first_result = False
+
+    def finish(self, authoritative_files_found, total_files):
+        self.writer.writeline(f"]{self._suffix}")
+
+
+def get_formatter(output_format, writer, verbosity=0, version=None):
+    if output_format == "text":
+        return TextFormatter(writer, verbosity)
+    if output_format == "jsonl":
+        return JsonlFormatter(writer, verbosity)
+    if output_format == "sarif":
+        return SarifFormatter(writer, verbosity, version=version)
+    raise ValueError(f"Unknown output format '{output_format}'")
@@ -0,0 +1,160 @@
+import io
+import json
+import subprocess
+
+import pytest
+
+from tf_authoritative_scanner.output import BufferedWriter, _sarif_artifact_location, get_formatter
+
+
+class TestOutput:
+    @pytest.fixture
+    def file_entries(self):
+        return [
+            {
+                "file_path": "a.tf",
+                "authoritative": True,
+                "authoritative_lines": [{"line_number": 3, "line": 'resource "google_project_iam_binding" "b" {'}],
+                "excepted_lines": [{"line_number": 9, "line": 'resource "google_project_iam_policy" "p" {'}],
+                "baselined_lines": [],
+            },
+            {
+                "file_path": "b.tf",
+                "authoritative": False,
+                "authoritative_lines": [],
+                "excepted_lines": [],
+                "baselined_lines": [{"line_number": 1, "line": 'resource "google_storage_bucket_acl" "acl" {'}],
+            },
+        ]
+
+    def render(self, output_format, file_entries, verbosity=0):
+        stream = io.StringIO()
+        writer = BufferedWriter(stream)
+        formatter = get_formatter(output_format, writer, verbosity)
+        formatter.start()
+        for file_entry in file_entries:
+            formatter.file_entry(file_entry)
+        formatter.finish(1, len(file_entries))
+        writer.flush()
+        return stream.getvalue()
+
+    def test_buffered_writer(self):
+        stream = io.StringIO()
+        writer = BufferedWriter(stream, buffer_size=10)
+        writer.writeline("abc")
+        assert stream.getvalue() == ""
+        writer.writeline("defghij")
+        assert stream.getvalue() == "abc\ndefghij\n"
+        writer.write("k")
+        writer.flush()
+        assert stream.getvalue() == "abc\ndefghij\nk"
+
+    def test_text(self, file_entries):
+        output = self.render("text", file_entries)
+        assert output == (
+            'AUTHORITATIVE: a.tf:3: resource "google_project_iam_binding" "b" {\n'
+            "FAIL: 1 of 2 scanned files are authoritative.\n"
+        )
+        output = self.render("text", file_entries, verbosity=1)
+        assert 'BASELINED: b.tf:1: resource "google_storage_bucket_acl" "acl" {\n' in output
+
+    def test_jsonl(self, file_entries):
+        records = [json.loads(line) for line in self.render("jsonl", file_entries).splitlines()]
+        assert [r["status"] for r in records] == ["authoritative", "excepted", "baselined", "fail"]
+        assert records[0] == {
+            "type": "finding",
+            "status": "authoritative",
+            "file_path": "a.tf",
+            "line_number": 3,
+            "resource_type": "google_project_iam_binding",
+            "resource_name": "b",
+            "line": 'resource "google_project_iam_binding" "b" {',
+        }
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["files_scanned"] == 2
+
+    def test_sarif(self, file_entries):
+        document = json.loads(self.render("sarif", file_entries))
+        assert document["version"] == "2.1.0"
+        results = document["runs"][0]["results"]
+        assert len(results) == 3
+        assert "suppressions" not in results[0]
+        assert results[0]["locations"][0]["physicalLocation"]["region"]["startLine"] == 3
+        assert results[1]["suppressions"] == [{"kind": "inSource"}]
+        assert results[2]["suppressions"] == [{"kind": "external"}]
+
+    def test_sarif_artifact_location(self):
+        assert _sarif_artifact_location("./mods/../my mod/100%#1.tf") == {
+            "uri": "my%20mod/100%25%231.tf",
+            "uriBaseId": "SRCROOT",
+        }
+        assert _sarif_artifact_location("/tmp/a b/m.tar.gz") == {"uri": "file:///tmp/a%20b/m.tar.gz"}
+
+    def test_sarif_original_uri_base_ids(self, file_entries):
+        document = json.loads(self.render("sarif", file_entries))
+        run = document["runs"][0]
+        assert run["originalUriBaseIds"]["SRCROOT"]["uri"].startswith("file:///")
+        assert run["originalUriBaseIds"]["SRCROOT"]["uri"].endswith("/")
+        assert run["results"][0]["locations"][0]["physicalLocation"]["artifactLocation"] == {
+            "uri": "a.tf",
+            "uriBaseId": "SRCROOT",
+        }
+
+    def test_sarif_archive_member(self):
+        file_entry = {
+            "file_path": "dist/m.zip!module/main.tf",
+            "archive_path": "dist/m.zip",
+            "member_name": "module/main.tf",
+            "authoritative": True,
+            "authoritative_lines": [{"line_number": 3, "line": 'resource "google_project_iam_binding" "b" {'}],
+            "excepted_lines": [],
+            "baselined_lines": [],
+        }
+        document = json.loads(self.render("sarif", [file_entry]))
+        location = document["runs"][0]["results"][0]["locations"][0]
+        assert location["physicalLocation"] == {"artifactLocation": {"uri": "dist/m.zip", "uriBaseId": "SRCROOT"}}
+        assert location["logicalLocations"] == [
+            {"name": "module/main.tf", "fullyQualifiedName": "dist/m.zip!module/main.tf"}
+        ]
+        assert location["properties"] == {"archiveMember": "module/main.tf", "archiveMemberLine": 3}
+
+    def test_sarif_empty(self):
+        document = json.loads(self.render("sarif", []))
+        assert document["runs"][0]["results"] == []
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            get_formatter("xml", BufferedWriter(io.StringIO()))
+
+    # main tests
+
+    def test_main_jsonl(self, tmp_path):
+        file = tmp_path / "test.tf"
+        file.write_text('resource "google_project_iam_binding" "test" {}')
+        result = subprocess.run(["tfas", "--format", "jsonl", str(file)], capture_output=True, text=True)
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert records[0]["status"] == "authoritative"
+        assert records[-1]["status"] == "fail"
+        assert result.returncode == 1
+
+    def test_main_sarif(self, tmp_path):
+        file = tmp_path / "test.tf"
+        file.write_text('resource "google_compute_instance" "test" {}')
+        result = subprocess.run(["tfas", "-f", "sarif", str(file)], capture_output=True, text=True)
+        document = json.loads(result.stdout)
+        assert document["runs"][0]["tool"]["driver"]["name"] == "tfas"
+        assert document["runs"][0]["results"] == []
+        assert result.returncode == 0
+
+    def test_main_write_baseline_machine_readable(self, tmp_path):
+        file = tmp_path / "test.tf"
+        file.write_text('resource "google_project_iam_binding" "test" {}')
+        baseline_path = str(tmp_path / "baseline.txt")
+        result = subprocess.run(
+            ["tfas", "--format", "jsonl", "--baseline", baseline_path, "--write-baseline", str(file)],
+            capture_output=True,
+            text=True,
+        )
+        assert result.stdout == ""
+        assert "Wrote 1 findings" in result.stderr
+        assert result.returncode == 0
@@ -0,0 +1,23 @@
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_IO_THREADS = 4
+
+
+# yields (item, load(item)) in the same order as `items`, while up to `depth` loads run ahead
+#   on a pool of `workers` threads. this overlaps slow I/O (e.g. network filesystems) with the
+#   caller's processing of already-loaded items, while keeping at most `depth` results in memory.
+# exceptions raised by `load` are re-raised when their item is reached.
+def read_ahead(items, load, workers=DEFAULT_IO_THREADS, depth=16):
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for item in items:
+            pending.append((item, executor.submit(load, item)))
+            if len(pending) >= depth:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
@@ -0,0 +1,110 @@
+import time
+import threading
+import subprocess
+
+import pytest
+
+from tf_authoritative_scanner.prefetch import read_ahead
+from tf_authoritative_scanner.scanner import TFAuthoritativeScanner
+
+
+# records how many `_read_file` calls are in flight at once
+class InFlightScanner(TFAuthoritativeScanner):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.second_read_started = threading.Event()
+
+    def _read_file(self, file_path):
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if self.in_flight > 1:
+                self.second_read_started.set()
+        try:
+            # hold the read open until another one overlaps it (or give up, failing the test)
+            self.second_read_started.wait(timeout=5)
+            time.sleep(0.005)
+            return super()._read_file(file_path)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestPrefetch:
+    @pytest.fixture
+    def tf_dir(self, tmp_path):
+        for i in range(20):
+            content = (
+                'resource "google_project_iam_binding" "b" {}\n'
+                if i % 2
+                else 'resource "google_compute_instance" "i" {}\n'
+            )
+            (tmp_path / f"file_{i:02}.tf").write_text(content)
+        # str.splitlines() would also break on the form feed and shift the line number
+        (tmp_path / "form_feed.tf").write_text('a = "x\fy"\nresource "google_project_iam_binding" "f" {}\n')
+        return str(tmp_path)
+
+    def test_read_ahead_preserves_order(self):
+        items = list(range(50))
+        assert list(read_ahead(items, lambda i: i * 2, workers=4, depth=8)) == [(i, i * 2) for i in items]
+
+    def test_read_ahead_is_bounded(self):
+        started = []
+        lock = threading.Lock()
+
+        def load(i):
+            with lock:
+                started.append(i)
+            return i
+
+        consumed = 0
+        for _item, _value in read_ahead(range(100), load, workers=2, depth=5):
+            consumed += 1
+            with lock:
+                assert len(started) <= consumed + 5
+
+    def test_read_ahead_reraises(self):
+        def load(i):
+            if i == 3:
+                raise FileNotFoundError(i)
+            return i
+
+        results = read_ahead(range(10), load, workers=2, depth=4)
+        assert [next(results) for _ in range(3)] == [(0, 0), (1, 1), (2, 2)]
+        with pytest.raises(FileNotFoundError):
+            next(results)
+
+    def test_read_ahead_invalid_depth(self):
+        with pytest.raises(ValueError):
+            list(read_ahead([1], lambda i: i, depth=0))
+
+    def test_scanner_read_ahead_matches_serial(self, tf_dir):
+        serial = TFAuthoritativeScanner(include_dotdirs=False).check_paths_for_authoritative_resources([tf_dir])
+        prefetched = TFAuthoritativeScanner(
+            include_dotdirs=False, read_ahead=8, io_threads=4
+        ).check_paths_for_authoritative_resources([tf_dir])
+        assert serial == prefetched
+        assert prefetched["authoritative_files_count"] == 11
+        form_feed = [r for r in prefetched["results"] if r["file_path"].endswith("form_feed.tf")][0]
+        assert form_feed["authoritative_lines"][0]["line_number"] == 2
+
+    def test_scanner_read_ahead_overlaps_reads(self, tf_dir):
+        scanner = InFlightScanner(include_dotdirs=False, read_ahead=16, io_threads=4)
+        scanner.check_paths_for_authoritative_resources([tf_dir])
+        assert 1 < scanner.peak_in_flight <= 4
+
+    # main tests
+
+    def test_main_read_ahead(self, tf_dir):
+        result = subprocess.run(
+            ["tfas", "-A", "--read-ahead", "4", "--io-threads", "2", tf_dir], capture_output=True, text=True
+        )
+        assert "FAIL: 11 of 21 scanned files are authoritative.\n" in result.stdout
+        assert result.returncode == 1
+
+    def test_main_read_ahead_invalid(self, tf_dir):
+        result = subprocess.run(["tfas", "-A", "--io-threads", "0", tf_dir], capture_output=True, text=True)
+        assert result.returncode == 2
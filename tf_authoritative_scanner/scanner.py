@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 
+import io
 import os
 import re
 import sys
+import tarfile
+import zipfile
+import zlib
 import argparse
 import os.path
 
+from tf_authoritative_scanner.baseline import Baseline
+from tf_authoritative_scanner.output import OUTPUT_FORMATS, BufferedWriter, get_formatter
+from tf_authoritative_scanner.prefetch import DEFAULT_IO_THREADS, read_ahead
 from tf_authoritative_scanner.util import (
     get_version,
     remove_leading_trailing_newline,
@@ -28,9 +35,31 @@ class TFAuthoritativeScanner:
 
     exception_comment_pattern = re.compile(r"#\s*terraform_authoritative_scanner_ok")
 
-    def __init__(self, include_dotdirs, verbosity=0):
+    # module archives that are scanned in place, without extracting them to disk
+    archive_suffixes = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+    # separates the archive path from the member path in reported file paths, e.g. 'module.zip!main.tf'
+    archive_member_separator = "!"
+    # used for files on disk and archive members alike. decoding is strict so undecodable input
+    #   fails the scan instead of hiding a resource, 'utf-8-sig' drops a leading byte order mark.
+    encoding = "utf-8-sig"
+
+    def __init__(
+        self,
+        include_dotdirs,
+        verbosity=0,
+        baseline=None,
+        output_format="text",
+        read_ahead=0,
+        io_threads=DEFAULT_IO_THREADS,
+    ):
         self.include_dotdirs = include_dotdirs
         self.verbosity = verbosity
+        self.output_format = output_format
+        # number of files to read ahead on background threads, 0 reads each file when it's scanned
+        self.read_ahead = read_ahead
+        self.io_threads = io_threads
+        # findings recorded in the baseline are reported separately and don't fail the scan
+        self.baseline = baseline if baseline is not None else Baseline()
 
     # examples:
     #   "google_project_iam_audit_config",  # https://registry.terraform.io/providers/hashicorp/google/latest/docs/resources/google_project_iam
@@ -77,14 +106,35 @@ class TFAuthoritativeScanner:
         return {"authoritative": False, "confidence": _confidence}
 
     def check_file_for_authoritative_resources(self, file_path):
-        with open(file_path, "r") as file:
-            lines = file.readlines()
+        with open(file_path, "r", encoding=self.encoding) as file:
+            return self.check_lines_for_authoritative_resources(file_path, file)
+
+    # reads the whole file in one call, used when reading ahead
+    def _read_file(self, file_path):
+        with open(file_path, "r", encoding=self.encoding) as file:
+            try:
+                return file.read()
+            except UnicodeDecodeError as e:
+                self._exit_invalid_encoding(file_path, e)
+
+    def _exit_invalid_encoding(self, file_path, error):
+        print(f"Error: The path '{file_path}' is not valid UTF-8 ({error}).")
+        sys.exit(1)
+
+    def _decoded_lines(self, file_path, lines):
+        try:
+            yield from lines
+        except UnicodeDecodeError as e:
+            self._exit_invalid_encoding(file_path, e)
 
+    # lines can be any iterable of strings (e.g. an open file), so input is streamed rather than read up front
+    def check_lines_for_authoritative_resources(self, file_path, lines):
         authoritative_lines = []
         excepted_lines = []
+        baselined_lines = []
         file_authoritative = False
         previous_line = ""
-        for line_number, line in enumerate(lines, start=1):
+        for line_number, line in enumerate(self._decoded_lines(file_path, lines), start=1):
             stripped_line = line.strip()
             # Ignore comment lines
             if stripped_line.startswith("#"):
@@ -95,13 +145,14 @@ class TFAuthoritativeScanner:
             r_authoritative = r["authoritative"]
             _r_confidence = r["confidence"]
             if r_authoritative:
-                if not self.exception_comment_pattern.search(line) and not self.exception_comment_pattern.search(
-                    previous_line
-                ):
+                if self.exception_comment_pattern.search(line) or self.exception_comment_pattern.search(previous_line):
+                    excepted_lines.append({"line_number": line_number, "line": stripped_line})
+                # an empty baseline (the default) skips fingerprinting entirely
+                elif self.baseline and self.baseline.contains(file_path, stripped_line):
+                    baselined_lines.append({"line_number": line_number, "line": stripped_line})
+                else:
                     authoritative_lines.append({"line_number": line_number, "line": stripped_line})
                     file_authoritative = True
-                else:
-                    excepted_lines.append({"line_number": line_number, "line": stripped_line})
             previous_line = stripped_line
 
         return {
@@ -109,6 +160,7 @@ class TFAuthoritativeScanner:
             "authoritative": file_authoritative,
             "authoritative_lines": authoritative_lines,
             "excepted_lines": excepted_lines,
+            "baselined_lines": baselined_lines,
         }
 
     def _scan_directory(self, directory):
@@ -119,22 +171,99 @@ class TFAuthoritativeScanner:
                 if file.endswith(".tf"):
                     yield os.path.join(root, file)
 
+    def is_archive(self, path):
+        return os.path.isfile(path) and str(path).lower().endswith(self.archive_suffixes)
+
+    def _is_scannable_member(self, member_name):
+        if not member_name.endswith(".tf"):
+            return False
+        if not self.include_dotdirs:
+            dirs = member_name.split("/")[:-1]
+            if any(d.startswith(".") and d not in (".", "..") for d in dirs):
+                return False
+        return True
+
+    # members are decoded and scanned line by line straight from the archive stream, so nothing
+    #   is written to disk and at most one member is open at a time
+    def check_archive_for_authoritative_resources(self, archive_path):
+        # truncated compressed data surfaces as EOFError or zlib.error rather than an archive error
+        try:
+            yield from self._scan_archive(archive_path)
+        except (zipfile.BadZipFile, tarfile.TarError, EOFError, zlib.error) as e:
+            print(f"Error: The path '{archive_path}' is not a valid archive ({e}).")
+            sys.exit(1)
+
+    def _scan_archive(self, archive_path):
+        if str(archive_path).lower().endswith(".zip"):
+            with zipfile.ZipFile(archive_path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir() or not self._is_scannable_member(info.filename):
+                        continue
+                    with archive.open(info) as member:
+                        yield self._check_archive_member(archive_path, info.filename, member)
+        else:
+            # members are read from the archive with transparent decompression, 'r:*' rather than
+            #   stream mode ('r|*') because TextIOWrapper needs a seekable member
+            with tarfile.open(archive_path, "r:*") as archive:
+                for info in archive:
+                    if not info.isfile() or not self._is_scannable_member(info.name):
+                        continue
+                    member = archive.extractfile(info)
+                    yield self._check_archive_member(archive_path, info.name, member)
+
+    def _check_archive_member(self, archive_path, member_name, member):
+        file_path = f"{archive_path}{self.archive_member_separator}{member_name}"
+        # text mode splits lines the same way as opening a file on disk (e.g. a lone '\r' is a line break)
+        lines = io.TextIOWrapper(member, encoding=self.encoding)
+        file_entry = self.check_lines_for_authoritative_resources(file_path, lines)
+        # kept separately so formatters don't have to split file_path
+        file_entry["archive_path"] = archive_path
+        file_entry["member_name"] = member_name
+        return file_entry
+
+    # yields (path, is_archive) for everything to scan, across all paths, so reading ahead
+    #   isn't interrupted at path boundaries (e.g. pre-commit passing many single files)
+    def _iter_scan_targets(self, paths):
+        for path in paths:
+            if os.path.isdir(path):
+                for file_path in self._scan_directory(path):
+                    yield file_path, False
+            else:
+                yield path, self.is_archive(path)
+
+    def _load_scan_target(self, target):
+        file_path, is_archive = target
+        # archives are streamed member by member when scanned, not read ahead
+        if is_archive:
+            return None
+        return self._read_file(file_path)
+
+    # yields one file entry per scanned file as soon as it has been scanned
+    def iter_paths_for_authoritative_resources(self, paths):
+        targets = self._iter_scan_targets(paths)
+        if self.read_ahead:
+            loaded = read_ahead(targets, self._load_scan_target, workers=self.io_threads, depth=self.read_ahead)
+        else:
+            loaded = ((target, None) for target in targets)
+
+        for (file_path, is_archive), content in loaded:
+            if is_archive:
+                yield from self.check_archive_for_authoritative_resources(file_path)
+            elif content is None:
+                yield self.check_file_for_authoritative_resources(file_path)
+            else:
+                # StringIO splits lines like the serial open() path, unlike str.splitlines() (e.g. on '\f')
+                yield self.check_lines_for_authoritative_resources(file_path, io.StringIO(content))
+
     def check_paths_for_authoritative_resources(self, directory):
         results = []
         total_files = 0
         authoritative_files_found = 0
-        for path in directory:
-            if os.path.isdir(path):
-                files = self._scan_directory(path)
-            else:
-                files = [path]
-
-            for file_path in files:
-                total_files += 1
-                file_entry = self.check_file_for_authoritative_resources(file_path)
-                results.append(file_entry)
-                if file_entry["authoritative"]:
-                    authoritative_files_found += 1
+        for file_entry in self.iter_paths_for_authoritative_resources(directory):
+            total_files += 1
+            results.append(file_entry)
+            if file_entry["authoritative"]:
+                authoritative_files_found += 1
         return {
             "files_scanned": total_files,
             "results": results,
@@ -144,42 +273,39 @@ class TFAuthoritativeScanner:
 
     def run(self, paths):
         total_files = 0
-        results = []
         authoritative_files_found = 0
 
         verify_paths(paths)
-        call_result = self.check_paths_for_authoritative_resources(paths)
-        results = call_result.get("results")
-        total_files = call_result.get("files_scanned")
-
-        for file_entry in results:
-            file_path = file_entry["file_path"]
-
+        writer = BufferedWriter()
+        formatter = get_formatter(self.output_format, writer, self.verbosity, version=get_version("__init__.py"))
+        formatter.start()
+        # results are formatted as they're produced rather than collected first
+        for file_entry in self.iter_paths_for_authoritative_resources(paths):
+            total_files += 1
             if file_entry["authoritative"]:
                 authoritative_files_found += 1
-                authoritative_lines = file_entry["authoritative_lines"]
-                for item in authoritative_lines:
-                    line_number = item["line_number"]
-                    line = item["line"]
-                    print(f"AUTHORITATIVE: {file_path}:{line_number}: {line}")
-            elif file_entry["excepted_lines"]:
-                if self.verbosity:
-                    excepted_lines = file_entry["excepted_lines"]
-                    for item in excepted_lines:
-                        line_number = item["line_number"]
-                        line = item["line"]
-                        print(f"EXCEPTED: {file_path}:{line_number}: {line}")
-            else:
-                if self.verbosity:
-                    print(f"OK: {file_path}")
+            formatter.file_entry(file_entry)
+        formatter.finish(authoritative_files_found, total_files)
+        writer.flush()
 
         if authoritative_files_found > 0:
-            print(f"FAIL: {authoritative_files_found} of {total_files} scanned files are authoritative.")
             sys.exit(1)
         else:
-            print(f"PASS: {authoritative_files_found} of {total_files} scanned files are authoritative.")
             sys.exit(0)
 
+    def write_baseline(self, paths, baseline_path):
+        verify_paths(paths)
+        call_result = self.check_paths_for_authoritative_resources(paths)
+        baseline = Baseline()
+        for file_entry in call_result.get("results"):
+            for item in file_entry["authoritative_lines"] + file_entry["baselined_lines"]:
+                baseline.add(file_entry["file_path"], item["line"])
+        baseline.write(baseline_path)
+        # keep stdout empty for machine-readable formats
+        stream = sys.stdout if self.output_format == "text" else sys.stderr
+        print(f"Wrote {len(baseline)} findings to baseline '{baseline_path}'.", file=stream)
+        sys.exit(0)
+
     def print_tfas_banner(self):
         # return
         print(
@@ -200,7 +326,9 @@ class TFAuthoritativeScanner:
 # TODO: move this to a cli.py file
 def main():
     parser = argparse.ArgumentParser(description="Static analysis of Terraform files for authoritative GCP resources.")
-    parser.add_argument("paths", metavar="path", type=str, nargs="+", help="File or directory to scan")
+    parser.add_argument(
+        "paths", metavar="path", type=str, nargs="+", help="File, directory, or module archive (.zip, .tar.gz) to scan"
+    )
     parser.add_argument(
         "-i",
         "--include-dotdirs",
@@ -220,9 +348,67 @@ def main():
         help="Increase verbosity level (can be used multiple times)",
     )
     parser.add_argument("--no-ascii-art", "-A", action="store_true", help="Do not print ASCII art")
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="Baseline file of accepted findings; only findings not in it will fail the scan",
+    )
+    parser.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help="Write all current findings to the --baseline file and exit",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--read-ahead",
+        metavar="DEPTH",
+        type=int,
+        default=0,
+        help="Read up to DEPTH files ahead on background threads, useful on slow or network filesystems "
+        "(default: %(default)s, disabled)",
+    )
+    parser.add_argument(
+        "--io-threads",
+        metavar="N",
+        type=int,
+        default=DEFAULT_IO_THREADS,
+        help="Number of threads used by --read-ahead (default: %(default)s)",
+    )
     args = parser.parse_args()
 
-    scanner = TFAuthoritativeScanner(args.include_dotdirs, args.verbose)
-    if not args.no_ascii_art:
+    if args.read_ahead < 0:
+        parser.error("--read-ahead must not be negative")
+    if args.io_threads < 1:
+        parser.error("--io-threads must be at least 1")
+
+    if args.write_baseline and not args.baseline:
+        parser.error("--write-baseline requires --baseline FILE")
+
+    baseline = None
+    if args.baseline and not args.write_baseline:
+        try:
+            baseline = Baseline.load(args.baseline)
+        except FileNotFoundError:
+            print(f"Error: The baseline file '{args.baseline}' does not exist.")
+            sys.exit(1)
+
+    scanner = TFAuthoritativeScanner(
+        args.include_dotdirs,
+        args.verbose,
+        baseline=baseline,
+        output_format=args.format,
+        read_ahead=args.read_ahead,
+        io_threads=args.io_threads,
+    )
+    # keep machine-readable output parseable
+    if not args.no_ascii_art and args.format == "text":
         scanner.print_tfas_banner()
+    if args.write_baseline:
+        scanner.write_baseline(args.paths, args.baseline)
     scanner.run(args.paths)
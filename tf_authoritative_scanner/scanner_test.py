@@ -1,6 +1,9 @@
 import pytest
 import os
+import io
+import tarfile
 import tempfile
+import zipfile
 import subprocess
 
 from tf_authoritative_scanner.scanner import TFAuthoritativeScanner
@@ -120,6 +123,29 @@ class TestTFAuthoritativeScanner:
             yield temp_file.name
         os.remove(temp_file.name)
 
+    @pytest.fixture
+    def temp_tf_zip(self, tmp_path):
+        archive_path = tmp_path / "module.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("module/main.tf", 'resource "google_project_iam_binding" "binding" {}\n')
+            archive.writestr("module/ok.tf", 'resource "google_compute_instance" "instance" {}\n')
+            archive.writestr("module/README.md", 'resource "google_project_iam_binding" "binding" {}\n')
+            archive.writestr("module/.terraform/hidden.tf", 'resource "google_project_iam_policy" "policy" {}\n')
+        return str(archive_path)
+
+    @pytest.fixture
+    def temp_tf_tarball(self, tmp_path):
+        archive_path = tmp_path / "module.tar.gz"
+        with tarfile.open(archive_path, "w:gz") as archive:
+            for name, content in [
+                ("module/main.tf", b'\n\nresource "google_project_iam_binding" "binding" {}\n'),
+                ("module/ok.tf", b'resource "google_compute_instance" "instance" {}\n'),
+            ]:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+        return str(archive_path)
+
     def test_initialization(self, scanner):
         assert not scanner.include_dotdirs
         assert scanner.verbosity == 1
@@ -168,6 +194,91 @@ class TestTFAuthoritativeScanner:
         assert len(r["results"][0]["authoritative_lines"]) == 0
         assert len(r["results"][0]["excepted_lines"]) == 1
 
+    def test_check_zip_archive(self, scanner, temp_tf_zip):
+        r = scanner.check_paths_for_authoritative_resources([temp_tf_zip])
+        assert r["files_scanned"] == 2
+        assert r["authoritative_files_count"] == 1
+        assert r["results"][0]["file_path"] == f"{temp_tf_zip}!module/main.tf"
+        assert r["results"][0]["archive_path"] == temp_tf_zip
+        assert r["results"][0]["member_name"] == "module/main.tf"
+        assert r["results"][0]["authoritative_lines"][0]["line_number"] == 1
+
+    def test_check_zip_archive_include_dotdirs(self, temp_tf_zip):
+        scanner = TFAuthoritativeScanner(include_dotdirs=True)
+        r = scanner.check_paths_for_authoritative_resources([temp_tf_zip])
+        assert r["files_scanned"] == 3
+        assert r["authoritative_files_count"] == 2
+
+    def test_check_tarball(self, scanner, temp_tf_tarball):
+        r = scanner.check_paths_for_authoritative_resources([temp_tf_tarball])
+        assert r["files_scanned"] == 2
+        assert r["authoritative_files_count"] == 1
+        assert r["results"][0]["file_path"] == f"{temp_tf_tarball}!module/main.tf"
+        assert r["results"][0]["authoritative_lines"][0]["line_number"] == 3
+
+    def test_check_invalid_archive(self, scanner, tmp_path, capsys):
+        not_a_zip = tmp_path / "x.zip"
+        not_a_zip.write_text('resource "google_project_iam_binding" "binding" {}\n')
+        with pytest.raises(SystemExit) as e:
+            scanner.check_paths_for_authoritative_resources([str(not_a_zip)])
+        assert e.value.code == 1
+        assert "is not a valid archive" in capsys.readouterr().out
+
+    def test_check_truncated_tarball(self, scanner, tmp_path, capsys):
+        archive_path = tmp_path / "module.tar.gz"
+        with tarfile.open(archive_path, "w:gz") as archive:
+            for i in range(10):
+                content = os.urandom(10000).hex().encode()
+                info = tarfile.TarInfo(f"module/{i}.tf")
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+        data = archive_path.read_bytes()
+        archive_path.write_bytes(data[: len(data) // 2])
+        with pytest.raises(SystemExit) as e:
+            scanner.check_paths_for_authoritative_resources([str(archive_path)])
+        assert e.value.code == 1
+        assert "is not a valid archive" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("read_ahead", [0, 2])
+    def test_check_invalid_utf8_fails_on_disk_and_in_archive(self, tmp_path, capsys, read_ahead):
+        scanner = TFAuthoritativeScanner(include_dotdirs=False, read_ahead=read_ahead)
+        content = b'\xff\xfe resource "google_project_iam_binding" "binding" {}\n'
+        file = tmp_path / "bad.tf"
+        file.write_bytes(content)
+        archive_path = tmp_path / "m.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("bad.tf", content)
+
+        for path in [file, archive_path]:
+            with pytest.raises(SystemExit) as e:
+                scanner.check_paths_for_authoritative_resources([str(path)])
+            assert e.value.code == 1
+            assert "is not valid UTF-8" in capsys.readouterr().out
+
+    def test_check_byte_order_mark(self, scanner, tmp_path):
+        content = '\ufeffresource "google_project_iam_binding" "binding" {}\n'.encode("utf-8")
+        file = tmp_path / "bom.tf"
+        file.write_bytes(content)
+        archive_path = tmp_path / "m.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("bom.tf", content)
+        r = scanner.check_paths_for_authoritative_resources([str(file), str(archive_path)])
+        assert r["authoritative_files_count"] == 2
+
+    def test_check_archive_cr_line_endings_match_disk(self, scanner, tmp_path):
+        content = 'x = 1\rresource "google_project_iam_binding" "c" {}\r'
+        file = tmp_path / "cr.tf"
+        file.write_bytes(content.encode("utf-8"))
+        archive_path = tmp_path / "m.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("cr.tf", content)
+
+        on_disk = scanner.check_paths_for_authoritative_resources([str(file)])
+        in_archive = scanner.check_paths_for_authoritative_resources([str(archive_path)])
+        assert in_archive["authoritative_files_count"] == 1
+        assert in_archive["results"][0]["authoritative_lines"] == on_disk["results"][0]["authoritative_lines"]
+        assert in_archive["results"][0]["authoritative_lines"][0]["line_number"] == 2
+
     # main tests
 
     def test_main_function(self, temp_tf_dir):
@@ -203,6 +314,20 @@ class TestTFAuthoritativeScanner:
         assert result.stderr == ""
         assert result.returncode == 0
 
+    def test_main_invalid_archive(self, tmp_path):
+        not_a_tarball = tmp_path / "module.tgz"
+        not_a_tarball.write_text("not a tarball")
+        result = subprocess.run(["tfas", "-A", str(not_a_tarball)], capture_output=True, text=True)
+        assert f"Error: The path '{not_a_tarball}' is not a valid archive" in result.stdout
+        assert "Traceback" not in result.stderr
+        assert result.returncode == 1
+
+    def test_main_archive(self, temp_tf_tarball):
+        result = subprocess.run(["tfas", "-A", temp_tf_tarball], capture_output=True, text=True)
+        assert f"AUTHORITATIVE: {temp_tf_tarball}!module/main.tf:3:" in result.stdout
+        assert "FAIL: 1 of 2 scanned files are authoritative.\n" in result.stdout
+        assert result.returncode == 1
+
     # tests for authoritative_resource_in_line
 
     def test_authoritative_resource_in_line_basic(self, scanner):
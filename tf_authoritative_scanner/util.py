@@ -54,3 +54,17 @@ def get_first_two_word_parts(string):
     first_word = remove_inner_quotes(word_parts[0])
     second_word = remove_inner_quotes(word_parts[1])
     return first_word, second_word
+
+
+# tokenizes the same way as the classifier (see get_first_two_word_parts), so unquoted and
+#   single-quoted labels are handled too. a trailing '{' or '{}' on the name is ignored, so
+#   `terraform fmt` doesn't change the result.
+# e.g. 'resource "google_project_iam_binding" "binding" {' -> "google_project_iam_binding", "binding"
+# returns "", "" if the string isn't a resource declaration and "<type>", "" if the name is missing
+def get_resource_type_and_name(string):
+    word_parts = string.split()
+    if len(word_parts) < 2 or remove_inner_quotes(word_parts[0]) != "resource":
+        return "", ""
+    resource_type = remove_inner_quotes(word_parts[1])
+    resource_name = remove_inner_quotes(word_parts[2]).rstrip("{}") if len(word_parts) > 2 else ""
+    return resource_type, resource_name
@@ -35,3 +35,31 @@ class TestUtil:
         # should raise an exception FileNotFoundError
         with pytest.raises(FileNotFoundError):
             util.get_version(f"{temp_empty_dir}/__init__.py")
+
+    def test_get_resource_type_and_name(self):
+        assert util.get_resource_type_and_name('resource "google_project_iam_binding" "binding" {') == (
+            "google_project_iam_binding",
+            "binding",
+        )
+        assert util.get_resource_type_and_name('resource "google_project_iam_binding" "binding"{') == (
+            "google_project_iam_binding",
+            "binding",
+        )
+        assert util.get_resource_type_and_name('resource "google_project_iam_binding" "binding"{}') == (
+            "google_project_iam_binding",
+            "binding",
+        )
+        assert util.get_resource_type_and_name("resource google_project_iam_binding binding {}") == (
+            "google_project_iam_binding",
+            "binding",
+        )
+        assert util.get_resource_type_and_name("resource 'google_project_iam_binding' 'binding' {") == (
+            "google_project_iam_binding",
+            "binding",
+        )
+        assert util.get_resource_type_and_name("resource google_project_iam_binding") == (
+            "google_project_iam_binding",
+            "",
+        )
+        assert util.get_resource_type_and_name("resource") == ("", "")
+        assert util.get_resource_type_and_name('data "google_iam_policy" "policy" {') == ("", "")